@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared nbconvert exporter and render cache for the HTML export scripts
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+
+import nbformat
+from nbconvert import HTMLExporter
+from nbconvert.preprocessors import Preprocessor
+from traitlets.config import Config
+
+# Rendered (body, resources) pairs are cached on disk keyed by the notebook
+# bytes, so unchanged notebooks skip the nbconvert render on re-runs
+_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'frankenstein_export')
+
+# One shared copy of plotly.js instead of the ~3 MB bundle per figure.
+# The figures call require(["plotly"], ...) and the page loads require.js,
+# so a bare CDN <script> tag would never register under that module name
+# (plotly's UMD wrapper hits the anonymous define branch); point require's
+# "plotly" path at the CDN instead, with a plain script tag for pages
+# without require.js
+_PLOTLY_CDN_URL = 'https://cdn.plot.ly/plotly-2.35.2.min'
+_PLOTLY_CDN = (
+    '<script>'
+    'if (typeof require !== "undefined" && require.config) {'
+    f'require.config({{paths: {{plotly: "{_PLOTLY_CDN_URL}"}}}});'
+    '} else {'
+    f'document.write(\'<script src="{_PLOTLY_CDN_URL}.js"><\\/script>\');'
+    '}'
+    '</script>'
+)
+
+
+def _strip_plotly_bundle(html, seen_bundle):
+    """Rewrite the inline plotly.js bundle inside one HTML output.
+
+    Bundles are recognized by the license banner at the top of the script
+    block (a size threshold alone could swallow an oversized Plotly.newPlot
+    data script); the first one found becomes the require.js shim pointing
+    at the CDN and later copies are dropped. seen_bundle is a one-element
+    list shared across outputs.
+    """
+    out = []
+    pos = 0
+    while True:
+        start = html.find('<script', pos)
+        if start == -1:
+            break
+        end = html.find('</script>', start)
+        if end == -1:
+            break
+        end += len('</script>')
+        head = html[start:start + 2000]
+        if 'plotly.js v' in head or 'Plotly, Inc.' in head:
+            out.append(html[pos:start])
+            if not seen_bundle[0]:
+                out.append(_PLOTLY_CDN)
+                seen_bundle[0] = True
+        else:
+            out.append(html[pos:end])
+        pos = end
+    out.append(html[pos:])
+    return ''.join(out)
+
+
+class StripPlotlyBundle(Preprocessor):
+    """Replace inline copies of the plotly.js bundle with one CDN script tag.
+
+    Plotly HTML outputs embed the full multi-MB bundle per figure when saved
+    with include_plotlyjs=True; stripping them cuts megabytes per chart from
+    the exported file.
+    """
+
+    def preprocess(self, nb, resources):
+        seen_bundle = [False]
+        for cell in nb.cells:
+            for output in cell.get('outputs', ()):
+                data = output.get('data', {})
+                html = data.get('text/html')
+                if not html:
+                    continue
+                if isinstance(html, list):
+                    html = ''.join(html)
+                data['text/html'] = _strip_plotly_bundle(html, seen_bundle)
+        return nb, resources
+
+
+@functools.lru_cache(maxsize=4)
+def get_exporter(hide_input=True, remove_cell_tags=()):
+    """Build a configured HTML exporter once per process and config, so
+    repeated calls reuse the compiled Jinja templates"""
+    c = Config()
+    c.HTMLExporter.exclude_input = hide_input  # Hide all code cells
+    c.HTMLExporter.exclude_output = False  # Keep outputs visible
+    c.HTMLExporter.exclude_output_prompt = hide_input  # Hide output prompts
+    c.HTMLExporter.exclude_input_prompt = hide_input  # Hide input prompts
+    if remove_cell_tags:
+        # Drop tagged cells inside nbconvert's preprocessor pipeline
+        # (same tags as nbconvert_config.py)
+        c.TagRemovePreprocessor.remove_cell_tags = set(remove_cell_tags)
+        c.TagRemovePreprocessor.enabled = True
+        c.HTMLExporter.preprocessors = ['nbconvert.preprocessors.TagRemovePreprocessor']
+    exporter = HTMLExporter(config=c)
+    exporter.register_preprocessor(StripPlotlyBundle(), enabled=True)
+    return exporter
+
+
+def load_notebook(raw):
+    """Parse notebook bytes. Fast path: plain json parse, skipping nbformat's
+    per-cell schema validation (the notebook is self-authored and trusted).
+    Fall back to the validating reader on anything unexpected."""
+    try:
+        return nbformat.from_dict(json.loads(raw))
+    except Exception:
+        # NO_CONVERT skips the version-upgrade walk as well; the notebook
+        # is already authored as v4
+        return nbformat.reads(raw.decode('utf-8'), as_version=nbformat.NO_CONVERT)
+
+
+def render_notebook(notebook_path, hide_input=True):
+    """Convert the notebook to HTML, reusing the cached render when the
+    notebook bytes have not changed since the last run"""
+    with open(notebook_path, 'rb') as f:
+        raw = f.read()
+    # the tag also versions the pipeline so config changes (like the plotly
+    # CDN rewrite) invalidate older cache entries
+    tag = (b'hide_input' if hide_input else b'show_input') + b'|cdn-plotly-shim'
+    digest = hashlib.blake2b(raw + tag, digest_size=16).hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f'{digest}.pkl')
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            # A torn or corrupt entry (e.g. from an interrupted run) just
+            # means a cache miss - re-render and overwrite it below
+            pass
+
+    body, resources = get_exporter(hide_input).from_notebook_node(load_notebook(raw))
+
+    # Write to a per-process temp file and rename it into place: the build
+    # script runs two exports concurrently and both may render the same
+    # notebook, so a plain truncating write could leave a half-written
+    # pickle for the other process (os.replace is atomic)
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump((body, resources), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+    return body, resources
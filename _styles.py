@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Shared style helpers for the HTML export scripts
+"""
+
+import re
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_WS = re.compile(r'\s+')
+_CSS_SEPARATORS = re.compile(r'\s*([{};:,>])\s*')
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a static CSS block.
+
+    Runs once at import over the module-level style constants, so the
+    source stays readable while every exported file ships the minified
+    bytes.
+    """
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_WS.sub(' ', css)
+    css = _CSS_SEPARATORS.sub(r'\1', css)
+    return css.strip()
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Build both styled HTML exports of the presentation notebook in parallel
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+
+def _run(job):
+    """Run one export in its own process. The imports live here so each
+    worker only pays for the module it actually runs."""
+    kind, notebook_file, output_file = job
+    if kind == 'custom':
+        from custom_html_export import create_custom_html_export
+        create_custom_html_export(notebook_file, output_file)
+    else:
+        from enhanced_html_export import create_enhanced_html_export
+        create_enhanced_html_export(notebook_file, output_file)
+
+
+if __name__ == "__main__":
+    notebook_file = r"c:\Users\joost\My Drive (joostburgers@gmail.com)\Teaching\JMU\Courses\Fall 2025\Eng 221\visualizing_frankenstein\frankenstein_presentation.ipynb"
+
+    jobs = [
+        ('custom', notebook_file,
+         r"c:\Users\joost\My Drive (joostburgers@gmail.com)\Teaching\JMU\Courses\Fall 2025\Eng 221\visualizing_frankenstein\frankenstein_presentation_final.html"),
+        ('enhanced', notebook_file,
+         r"c:\Users\joost\My Drive (joostburgers@gmail.com)\Teaching\JMU\Courses\Fall 2025\Eng 221\visualizing_frankenstein\frankenstein_presentation_professional.html"),
+    ]
+
+    print("🚀 Building both HTML exports in parallel...")
+    # The two exports are independent, so the nbconvert/Jinja work overlaps
+    # on separate cores (and the shared render cache serves whichever
+    # process gets there second on later runs)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        list(executor.map(_run, jobs))
+    print("✅ Both exports complete!")
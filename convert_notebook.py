@@ -3,58 +3,76 @@
 Custom notebook converter to hide specific cells during HTML export
 """
 
-import nbformat
-import sys
-from nbconvert import HTMLExporter
-from nbconvert.preprocessors import TagRemovePreprocessor
-from traitlets.config import Config
+from _exporter import get_exporter, load_notebook
 import os
 
-def convert_notebook_hide_cells(notebook_path, output_path, cells_to_hide=None):
+def convert_notebook_hide_cells(notebook_path, output_path, cells_to_hide=None,
+                                remove_tags=("hide_cell",)):
     """
     Convert notebook to HTML while hiding specified cells
-    
+
+    Cells tagged with any of remove_tags (the same "hide_cell" tag that
+    nbconvert_config.py uses) are removed inside nbconvert's preprocessor
+    pipeline, so the notebook no longer needs re-editing by index when
+    cells move around.
+
     Args:
         notebook_path (str): Path to input notebook
         output_path (str): Path for output HTML file
-        cells_to_hide (list): List of cell indices to hide (0-based)
+        cells_to_hide (list): List of cell indices to hide (0-based),
+            fallback for notebooks without tagged cells
+        remove_tags (tuple): Cell tags removed during export
     """
-    
-    # Read the notebook
-    with open(notebook_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
-    
-    # If specific cells to hide are provided, remove them
-    if cells_to_hide:
-        # Remove cells in reverse order to maintain indices
-        for cell_idx in sorted(cells_to_hide, reverse=True):
-            if 0 <= cell_idx < len(nb.cells):
-                print(f"Hiding cell {cell_idx}")
-                del nb.cells[cell_idx]
-    
-    # Configure the HTML exporter
-    c = Config()
-    c.HTMLExporter.exclude_input = False  # Keep input cells visible (except hidden ones)
-    c.HTMLExporter.exclude_output = False  # Keep outputs visible
-    
-    # Create HTML exporter
-    html_exporter = HTMLExporter(config=c)
+
+    # Read the notebook (fast json path via the shared loader)
+    with open(notebook_path, 'rb') as f:
+        raw = f.read()
+    nb = load_notebook(raw)
+
+    # Index-based fallback for notebooks whose cells are not tagged, done
+    # in a single pass (deleting by index shifts the whole list on every
+    # del). Only used when no cell carries a remove tag - otherwise the
+    # indices would delete extra cells on top of the tagged ones.
+    remove_tags = tuple(remove_tags or ())
+    has_tagged_cells = any(
+        set(cell.get('metadata', {}).get('tags', ())) & set(remove_tags)
+        for cell in nb.cells
+    )
+    if cells_to_hide and not has_tagged_cells:
+        hide = {idx for idx in cells_to_hide if 0 <= idx < len(nb.cells)}
+        for cell_idx in sorted(hide):
+            print(f"Hiding cell {cell_idx}")
+        nb.cells = [cell for idx, cell in enumerate(nb.cells) if idx not in hide]
+
+    # Shared exporter (keeps input cells visible, drops tagged cells)
+    html_exporter = get_exporter(hide_input=False,
+                                 remove_cell_tags=remove_tags)
     
     # Convert to HTML
     (body, resources) = html_exporter.from_notebook_node(nb)
     
-    # Write HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(body)
+    # Write HTML file (binary mode with a 1 MB buffer - the default 8 KB
+    # buffer is far too small for multi-MB HTML output)
+    encoded = body.encode('utf-8')
+    with open(output_path, 'wb', buffering=1024 * 1024) as f:
+        # Reserve contiguous blocks up front; helps sustained sequential
+        # writes on lazily allocating filesystems (not available on Windows)
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, len(encoded))
+        f.write(encoded)
     
+    del body  # let the large string be collected before reporting
+
     print(f"Converted notebook to HTML: {output_path}")
-    print(f"File size: {len(body)/1024/1024:.2f} MB")
+    print(f"File size: {os.path.getsize(output_path)/1024/1024:.2f} MB")
 
 if __name__ == "__main__":
     notebook_file = r"c:\Users\joost\My Drive (joostburgers@gmail.com)\Teaching\JMU\Courses\Fall 2025\Eng 221\visualizing_frankenstein\frankenstein_presentation.ipynb"
     output_file = r"c:\Users\joost\My Drive (joostburgers@gmail.com)\Teaching\JMU\Courses\Fall 2025\Eng 221\visualizing_frankenstein\frankenstein_presentation_hidden.html"
     
-    # Cell 2 is the data loading cell (0-based indexing: cell 0=title, cell 1=toc, cell 2=data loading)
+    # The data loading cell is tagged "hide_cell" in the notebook and gets
+    # removed by the TagRemovePreprocessor; the index is kept as a fallback
+    # (0-based: cell 0=title, cell 1=toc, cell 2=data loading)
     cells_to_hide = [2]  # Hide the data loading cell
-    
+
     convert_notebook_hide_cells(notebook_file, output_file, cells_to_hide)
\ No newline at end of file
@@ -3,35 +3,15 @@
 Custom notebook converter with proper TOC and styling
 """
 
-import nbformat
-import json
-from nbconvert import HTMLExporter
-from traitlets.config import Config
+from _exporter import render_notebook
+from _styles import minify_css
+import gzip
+import hashlib
+import os
 import re
 
-def create_custom_html_export(notebook_path, output_path):
-    """
-    Convert notebook to HTML with proper TOC, hidden code cells, and custom styling
-    """
-    
-    # Read the notebook
-    with open(notebook_path, 'r', encoding='utf-8') as f:
-        nb = nbformat.read(f, as_version=4)
-    
-    # Configure the HTML exporter to hide input cells
-    c = Config()
-    c.HTMLExporter.exclude_input = True  # Hide all code cells
-    c.HTMLExporter.exclude_output_prompt = True  # Hide output prompts
-    c.HTMLExporter.exclude_input_prompt = True  # Hide input prompts
-    
-    # Create HTML exporter
-    html_exporter = HTMLExporter(config=c)
-    
-    # Convert to HTML
-    (body, resources) = html_exporter.from_notebook_node(nb)
-    
-    # Custom CSS for better layout and working TOC
-    custom_css = """
+# Custom CSS for better layout and working TOC, built once at import
+_CUSTOM_CSS = minify_css("""
     <style>
     /* Main layout - centered with margins */
     body {
@@ -289,54 +269,118 @@ def create_custom_html_export(notebook_path, output_path):
         scroll-margin-top: 20px;
     }
     </style>
+""")
+
+# Bump when the export pipeline changes in a way that alters the output
+# (the notebook bytes and the CSS are hashed in automatically)
+_EXPORT_VERSION = b'2'  # 2: require.js-aware plotly CDN shim
+
+# Single compiled alternation covering every fix-up applied to the exported
+# HTML. One pass over the multi-MB body replaces the previous six sequential
+# find/sub/replace scans. Order matters: the TOC heading must match its own
+# branch before the generic heading branch. The heading text uses the
+# non-backtracking [^<]{0,512} instead of a non-greedy .*?, which would
+# probe position by position across the whole document.
+_REWRITE_PATTERN = re.compile(
+    r'(?P<head></head>)'
+    r'|(?P<body><body>)'
+    r'|(?P<bodyend></body>)'
+    r'|(?P<toc><h2>Table of Contents</h2>)'
+    r'|(?P<h><(?P<htag>h[1-6])>(?P<htext>[^<]{0,512})</h[1-6]>)'
+    r'|(?P<hr><hr>)'
+)
+
+# Slug helpers for heading IDs: a translate table deletes punctuation in one
+# C-level pass, and a single precompiled pattern collapses whitespace and
+# hyphen runs
+_SLUG_DELETE = str.maketrans('', '', ''.join(
+    chr(i) for i in range(128) if not (chr(i).isalnum() or chr(i) in ' \t\n-_')
+))
+_SLUG_SEPARATORS = re.compile(r'[-\s]+')
+
+
+def _make_heading_id(heading_text):
+    """Create a proper ID from a heading's text"""
+    slug = heading_text.lower().translate(_SLUG_DELETE)
+    return _SLUG_SEPARATORS.sub('-', slug).strip('-')
+
+def create_custom_html_export(notebook_path, output_path):
     """
-    
-    # Inject the custom CSS and wrap content in container
-    # Find the </head> tag and insert CSS before it
-    head_end = body.find('</head>')
-    if head_end != -1:
-        body = body[:head_end] + custom_css + body[head_end:]
-    
-    # Wrap the main content in a container div
-    # Find the body content and wrap it
-    body_start = body.find('<body>')
-    body_end = body.find('</body>')
-    
-    if body_start != -1 and body_end != -1:
-        content_start = body.find('<div class="container">', body_start)
-        if content_start == -1:  # If container doesn't exist, create it
-            original_content = body[body_start + 6:body_end]  # +6 to skip <body>
-            new_content = f'<body><div class="container">{original_content}</div>'
-            body = body[:body_start] + new_content + body[body_end:]
-    
-    # Fix the table of contents to work properly
-    # Make sure all heading IDs are properly formatted
-    def fix_heading_ids(match):
-        heading_tag = match.group(1)
-        heading_text = match.group(2)
-        # Create a proper ID from the heading text
-        heading_id = re.sub(r'[^\w\s-]', '', heading_text.lower())
-        heading_id = re.sub(r'[-\s]+', '-', heading_id).strip('-')
-        return f'<{heading_tag} id="{heading_id}">{heading_text}</{heading_tag}>'
-    
-    # Fix heading IDs
-    body = re.sub(r'<(h[1-6])>(.*?)</h[1-6]>', fix_heading_ids, body)
-    
-    # Also add the TOC container class
-    body = body.replace('<h2>Table of Contents</h2>', '<div class="toc-container"><h2>Table of Contents</h2>')
-    
-    # Find the end of the TOC (look for the next h2 or the hr after TOC)
-    toc_end = body.find('<hr>', body.find('Table of Contents'))
-    if toc_end != -1:
-        hr_end = body.find('>', toc_end) + 1
-        body = body[:hr_end] + '</div>' + body[hr_end:]
-    
-    # Write the final HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(body)
-    
+    Convert notebook to HTML with proper TOC, hidden code cells, and custom styling
+    """
+
+    # Skip the whole conversion when neither the notebook nor the export
+    # pipeline has changed since the last run
+    with open(notebook_path, 'rb') as f:
+        src_hash = hashlib.blake2b(
+            f.read() + _CUSTOM_CSS.encode('utf-8') + _EXPORT_VERSION,
+            digest_size=16).hexdigest()
+    hash_path = output_path + '.hash'
+    if os.path.exists(output_path) and os.path.exists(hash_path):
+        with open(hash_path) as f:
+            if f.read().strip() == src_hash:
+                print(f"⏭️ Notebook unchanged, keeping existing export: {output_path}")
+                return
+
+    # Convert to HTML (cached between runs on the notebook contents)
+    (body, resources) = render_notebook(notebook_path)
+
+
+    # Apply all fix-ups in a single pass over the body:
+    # - inject the custom CSS before </head>
+    # - wrap the body content in a container div
+    # - give the TOC its container and every heading a proper ID
+    # - close the TOC container at the first <hr> after the TOC
+    toc_open = False
+
+    def rewrite(match):
+        nonlocal toc_open
+        if match.group('head') is not None:
+            return _CUSTOM_CSS + '</head>'
+        if match.group('body') is not None:
+            return '<body><div class="container">'
+        if match.group('bodyend') is not None:
+            return '</div></body>'
+        if match.group('toc') is not None:
+            toc_open = True
+            return '<div class="toc-container"><h2 id="table-of-contents">Table of Contents</h2>'
+        if match.group('h') is not None:
+            heading_tag = match.group('htag')
+            heading_text = match.group('htext')
+            return f'<{heading_tag} id="{_make_heading_id(heading_text)}">{heading_text}</{heading_tag}>'
+        if toc_open:  # first <hr> after the TOC closes its container
+            toc_open = False
+            return '<hr></div>'
+        return match.group(0)
+
+    # Stream the rewritten HTML straight to disk: walk the matches once and
+    # write the unchanged spans and replacements as we go, instead of
+    # materializing a second multi-MB string with .sub() first. The 1 MB
+    # buffer keeps the actual write() syscall count low. A pre-compressed
+    # .html.gz sidecar is written alongside so static servers can send the
+    # compressed bytes directly (e.g. nginx gzip_static).
+    with open(output_path, 'wb', buffering=1024 * 1024) as f, \
+            gzip.open(output_path + '.gz', 'wb', compresslevel=9) as gz:
+        def emit(chunk):
+            data = chunk.encode('utf-8')
+            f.write(data)
+            gz.write(data)
+
+        last = 0
+        for match in _REWRITE_PATTERN.finditer(body):
+            emit(body[last:match.start()])
+            emit(rewrite(match))
+            last = match.end()
+        emit(body[last:])
+    
+    with open(hash_path, 'w') as f:
+        f.write(src_hash)
+
+    del body  # let the large string be collected before reporting
+
     print(f"✅ Created custom HTML export: {output_path}")
-    print(f"📏 File size: {len(body)/1024/1024:.2f} MB")
+    print(f"🗜️ Pre-compressed copy: {output_path}.gz")
+    print(f"📏 File size: {os.path.getsize(output_path)/1024/1024:.2f} MB")
     print("🎨 Features: Working TOC, hidden code cells, centered layout, custom styling")
 
 if __name__ == "__main__":